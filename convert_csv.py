@@ -1,10 +1,26 @@
 import csv
 import json
-import base64
 import sys
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from urllib.parse import urlparse, parse_qs
+from functools import partial
+from urllib.parse import unquote_plus
+
+try:
+    # SIMD base64 decoder (optional, same API as the stdlib)
+    from pybase64 import b64decode
+except ImportError:
+    # base64.b64decode is a Python wrapper around this; calling the C
+    # function directly saves a frame per field on files with small rows
+    from binascii import a2b_base64 as b64decode
+
+try:
+    # Rust JSON encoder (optional, falls back to the stdlib json module)
+    import orjson
+except ImportError:
+    orjson = None
 
 # ===============================================
 # 1. Increase field size limit (for large files)
@@ -14,106 +30,96 @@ try:
 except OverflowError:
     csv.field_size_limit(2147483647)
 
+# Only the first few row errors are printed
+MAX_REPORTED_ERRORS = 5
+
+# Header names compared after lower-casing
+COOKIE_HEADERS = frozenset((b'cookie', b'set-cookie'))
+
 def decode_base64_safe(data):
-    """Base64 decoding safely"""
-    if not data or not isinstance(data, str):
-        return ""
+    """Base64 decoding safely (accepts str or bytes), returns the raw bytes"""
+    if not data or not isinstance(data, (str, bytes)):
+        return b""
     try:
-        decoded = base64.b64decode(data)
-        return decoded.decode('utf-8', errors='replace')
+        return b64decode(data)
     except Exception:
-        return data
+        return data.encode('utf-8') if isinstance(data, str) else data
 
-def parse_http_headers(raw_text):
-    """Extracting my HTTP request/response headers"""
+def parse_request_or_response(raw):
+    """
+    Parse a raw HTTP request/response in one pass.
+    
+    Returns (headers, cookies, body, http_version, status_text, mime_type);
+    body stays bytes, cookies come from Cookie/Set-Cookie headers and
+    mime_type from the first Content-Type header ("" if none).
+    """
     headers = []
-    if not raw_text or not isinstance(raw_text, str):
-        return headers
-    try:
-        lines = raw_text.split('\r\n')
-        for line in lines[1:]:
-            if not line.strip():
-                break
-            if ':' in line:
-                parts = line.split(':', 1)
-                if len(parts) == 2:
-                    headers.append({
-                        "name": parts[0].strip(), 
-                        "value": parts[1].strip()
-                    })
-    except Exception:
-        pass
-    return headers
-
-def parse_cookies_from_headers(headers):
-    """Extracting cookies from headers"""
     cookies = []
-    for header in headers:
-        if header.get('name', '').lower() in ['cookie', 'set-cookie']:
-            cookie_str = header.get('value', '')
-            # Simple analysis of cookies
-            for cookie_part in cookie_str.split(';'):
-                if '=' in cookie_part:
-                    name, value = cookie_part.split('=', 1)
-                    cookies.append({
-                        "name": name.strip(),
-                        "value": value.strip()
-                    })
-    return cookies
-
-def extract_http_version(raw_text):
-    """Extract the HTTP version"""
-    if not raw_text or not isinstance(raw_text, str): 
-        return "HTTP/1.1"
-    try:
-        first = raw_text.split('\r\n')[0] if '\r\n' in raw_text else raw_text.split('\n')[0]
-        if 'HTTP/2' in first: 
-            return 'HTTP/2'
-        elif 'HTTP/1.0' in first: 
-            return 'HTTP/1.0'
-        elif 'HTTP/1.1' in first:
-            return 'HTTP/1.1'
-    except: 
-        pass
-    return 'HTTP/1.1'
-
-def extract_status_text(raw_response):
-    """Extract response status text (eg OK, Not Found)"""
-    if not raw_response or not isinstance(raw_response, str): 
-        return ""
-    try:
-        first = raw_response.split('\r\n')[0] if '\r\n' in raw_response else raw_response.split('\n')[0]
-        parts = first.split(' ', 2)
-        if len(parts) >= 3: 
-            return parts[2].strip()
-    except: 
-        pass
-    return ""
-
-def extract_body(raw_text):
-    """Extract the body of the request or response"""
-    if not raw_text or not isinstance(raw_text, str): 
-        return ""
-    try:
-        if '\r\n\r\n' in raw_text: 
-            return raw_text.split('\r\n\r\n', 1)[1]
-        elif '\n\n' in raw_text: 
-            return raw_text.split('\n\n', 1)[1]
-    except: 
-        pass
-    return ""
+    mime_type = ""
+    if not raw:
+        return headers, cookies, b"", "HTTP/1.1", "", mime_type
+    
+    # Locate the blank line once; only the header block gets split into lines
+    head, sep, body = raw.partition(b'\r\n\r\n')
+    if not sep:
+        head, sep, body = raw.partition(b'\n\n')
+    
+    end = head.find(b'\n')
+    first = head if end < 0 else head[:end]
+    if first.endswith(b'\r'):
+        first = first[:-1]
+    
+    if b'HTTP/2' in first:
+        http_version = 'HTTP/2'
+    elif b'HTTP/1.0' in first:
+        http_version = 'HTTP/1.0'
+    else:
+        http_version = 'HTTP/1.1'
+    
+    parts = first.split(b' ', 2)
+    status_text = parts[2].strip().decode('utf-8', errors='replace') if len(parts) >= 3 else ""
+    
+    for line in head.split(b'\r\n')[1:]:
+        if not line.strip():
+            break
+        if b':' in line:
+            name, value = line.split(b':', 1)
+            name = name.strip()
+            value = value.strip()
+            lname = name.lower()
+            if lname in COOKIE_HEADERS:
+                for cookie_part in value.split(b';'):
+                    if b'=' in cookie_part:
+                        cookie_name, cookie_value = cookie_part.split(b'=', 1)
+                        cookies.append({
+                            "name": cookie_name.strip().decode('utf-8', errors='replace'),
+                            "value": cookie_value.strip().decode('utf-8', errors='replace')
+                        })
+            elif not mime_type and lname == b'content-type':
+                mime_type = value.partition(b';')[0].strip().decode('utf-8', errors='replace')
+            headers.append({
+                "name": name.decode('utf-8', errors='replace'), 
+                "value": value.decode('utf-8', errors='replace')
+            })
+    
+    return headers, cookies, body, http_version, status_text, mime_type
 
 def extract_query_string(url):
-    """Extracting query parameters from the URL"""
-    if not url:
+    """Extracting query parameters from the URL (in their original order)"""
+    if not url or '?' not in url:
         return []
     try:
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query, keep_blank_values=True)
+        query = url.partition('#')[0].partition('?')[2]
         query_list = []
-        for key, values in params.items():
-            for value in values:
-                query_list.append({"name": key, "value": value})
+        for pair in query.split('&'):
+            if not pair:
+                continue
+            name, _, value = pair.partition('=')
+            # Only pay for unquoting when something is actually encoded
+            if '%' in pair or '+' in pair:
+                name = unquote_plus(name)
+                value = unquote_plus(value)
+            query_list.append({"name": name, "value": value})
         return query_list
     except:
         return []
@@ -132,58 +138,243 @@ def calculate_headers_size(headers):
 
 def safe_int(value, default=0):
     """Safe conversion to integer"""
-    if value is None or value == '': 
+    if value is None: 
         return default
+    s = (value if isinstance(value, str) else str(value)).strip()
+    if not s: 
+        return default
+    if ',' in s:
+        s = s.replace(',', '')
     try:
-        clean = str(value).strip().replace(',', '')
-        if clean.replace('-', '').replace('.', '').isdigit(): 
-            return int(float(clean))
-    except: 
+        return int(s)
+    except ValueError:
         pass
-    return default
+    try:
+        return int(float(s))
+    except (ValueError, OverflowError): 
+        return default
 
 def safe_float(value, default=0.0):
     """Safe conversion to float"""
-    if value is None or value == '': 
+    if value is None: 
         return default
+    s = (value if isinstance(value, str) else str(value)).strip()
+    if not s: 
+        return default
+    if ',' in s:
+        s = s.replace(',', '')
     try:
-        clean = str(value).strip().replace(',', '')
-        return float(clean)
-    except: 
-        pass
-    return default
+        return float(s)
+    except ValueError: 
+        return default
 
-def calculate_timings(row):
-    """Calculate timings accurately from available data"""
-    start = safe_float(row.get('Start response timer'))
-    end = safe_float(row.get('End response timer'))
+def calculate_timings(start_timer, end_timer, send_time, receive_time):
+    """
+    Calculate timings accurately from available data.
+    
+    Returns (send, wait, receive, total); total sums the positive phases.
+    """
+    start = safe_float(start_timer)
+    end = safe_float(end_timer)
     
     wait_time = max(0, end - start) if (start and end) else 0
     
     # Try to extract additional timings if they exist
-    send = safe_float(row.get('Send time'), 0)
-    receive = safe_float(row.get('Receive time'), 0)
-    
-    return {
-        "blocked": -1,
-        "dns": -1,
-        "connect": -1,
-        "send": send,
-        "wait": wait_time,
-        "receive": receive,
-        "ssl": -1
+    send = safe_float(send_time, 0)
+    receive = safe_float(receive_time, 0)
+    
+    total = max(send, 0) + wait_time + max(receive, 0)
+    return send, wait_time, receive, total
+
+def dumps(value):
+    """Serialize a value to compact UTF-8 encoded JSON"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, let json handle them
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def drop_written_pages(f_out):
+    """Flush the output and let the kernel drop its cached pages (Linux only)"""
+    if hasattr(os, 'posix_fadvise'):
+        f_out.flush()
+        try:
+            os.posix_fadvise(f_out.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass  # pipes and terminals (ESPIPE); the hint is best-effort
+
+# Columns read per row, in the order build_entry unpacks their positions
+ROW_COLUMNS = (
+    'Request', 'Response', 'MIME type', 'Method', 'URL', 'Status code',
+    'Length', 'Redirect URL', 'Start response timer', 'End response timer',
+    'Send time', 'Receive time', 'Time', 'IP', 'Connection ID',
+)
+
+def resolve_columns(fieldnames):
+    """Map ROW_COLUMNS to their positions in the header (-1 when absent)"""
+    positions = {name: i for i, name in enumerate(fieldnames)}
+    return tuple(positions.get(name, -1) for name in ROW_COLUMNS)
+
+def build_entry(row, raw_req, raw_res, fieldnames, columns, default_time, preserve_all_data=True,
+                n_fields=None, *, _parse=parse_request_or_response, _query=extract_query_string,
+                _headers_size=calculate_headers_size,
+                _int=safe_int, _timings=calculate_timings, _dumps=dumps, _len=len):
+    """
+    Build the HAR entry for one CSV row, encoded as a single line of JSON.
+    
+    row must already be padded by build_entries_chunk; raw_req/raw_res are
+    its decoded Request and Response fields and n_fields its length before
+    padding (default: one field per column). default_time stands in for a
+    missing or empty Time value. The keyword-only defaults bind the helpers
+    called per row to locals; they are not meant to be passed.
+    """
+    (_, _, i_mime, i_method, i_url, i_status, i_length, i_redirect,
+     i_start, i_end, i_send, i_receive, i_time, i_ip, i_conn) = columns
+    
+    # Extract Headers, Cookies, Bodies and the start-line fields
+    req_headers, req_cookies, req_body, req_version, _, req_mime = _parse(raw_req)
+    res_headers, res_cookies, res_body, res_version, res_status_text, res_mime = _parse(raw_res)
+    
+    # Extract MIME type from headers or CSV
+    response_mime = res_mime or row[i_mime].strip()
+    
+    # Built Request
+    method = row[i_method].strip() or 'GET'
+    url = row[i_url].strip()
+    
+    request_obj = {
+        "method": method,
+        "url": url,
+        "httpVersion": req_version,
+        "cookies": req_cookies,
+        "headers": req_headers,
+        "queryString": _query(url),
+        "headersSize": _headers_size(req_headers),
+        "bodySize": _len(req_body)
     }
+    
+    # Add postData if it exists
+    if req_body and method.upper() in ["POST", "PUT", "PATCH", "DELETE"]:
+        request_mime = req_mime or "application/octet-stream"
+        request_obj["postData"] = {
+            "mimeType": request_mime,
+            "text": req_body.decode('utf-8', errors='replace'),
+            "params": []
+        }
+    
+    # Build Response
+    status_code = _int(row[i_status])
+    content_size = _int(row[i_length], -1)
+    
+    # Calculate time
+    send, wait, receive, total_time = _timings(row[i_start], row[i_end], row[i_send], row[i_receive])
+    
+    started = row[i_time] or default_time
+    
+    # Build Entry: the fixed keys are written as pre-encoded fragments and
+    # only the values go through the JSON encoder
+    parts = [
+        b'{"startedDateTime":', _dumps(started),
+        b',"time":', _dumps(total_time),
+        b',"request":', _dumps(request_obj),
+        b',"response":{"status":', b'%d' % status_code,
+        b',"statusText":', _dumps(res_status_text),
+        b',"httpVersion":', _dumps(res_version if raw_res else req_version),
+        b',"cookies":', _dumps(res_cookies),
+        b',"headers":', _dumps(res_headers),
+        b',"content":{"size":', b'%d' % content_size,
+        b',"mimeType":', _dumps(response_mime),
+        b',"text":', _dumps(res_body.decode('utf-8', errors='replace')),
+        b',"encoding":"utf-8"},"redirectURL":', _dumps(row[i_redirect].strip()),
+        b',"headersSize":', b'%d' % _headers_size(res_headers),
+        b',"bodySize":', b'%d' % content_size,
+        b'},"cache":{},"timings":{"blocked":-1,"dns":-1,"connect":-1,"send":', _dumps(send),
+        b',"wait":', _dumps(wait),
+        b',"receive":', _dumps(receive),
+        b',"ssl":-1}',
+        b',"serverIPAddress":', _dumps(row[i_ip].strip()),
+        b',"connection":', _dumps(row[i_conn].strip()),
+    ]
+    
+    # Save all original data (very important!)
+    if preserve_all_data:
+        parts.append(b',"_csvOriginalData":')
+        # Same shape csv.DictReader produced: missing fields are null and
+        # extra fields are listed under a "null" key
+        width = _len(fieldnames)
+        if n_fields is None or n_fields == width:
+            original = dict(zip(fieldnames, row))
+        elif n_fields < width:
+            original = dict(zip(fieldnames[:n_fields], row))
+            original.update(dict.fromkeys(fieldnames[n_fields:]))
+        else:
+            original = dict(zip(fieldnames, row))
+            original['null'] = row[width:n_fields]
+        parts.append(_dumps(original))
+    
+    parts.append(b'}')
+    return b''.join(parts)
 
-def get_mime_type_from_headers(headers):
-    """Extract MIME type from Content-Type header"""
-    for header in headers:
-        if header.get('name', '').lower() == 'content-type':
-            value = header.get('value', '')
-            # Extract the first part before;
-            return value.split(';')[0].strip()
-    return ""
+def build_entries_chunk(chunk, fieldnames, columns, default_time, preserve_all_data=True,
+                        *, _decode=decode_base64_safe, _build=build_entry):
+    """
+    Convert a chunk of (idx, row) pairs into one block of serialized entries.
+    
+    Runs inside the worker processes. Returns (blob, processed, errors) where
+    blob holds the entries joined by HAR separators and errors lists
+    (idx, message) for the rows that were skipped (message is None past the
+    first MAX_REPORTED_ERRORS).
+    """
+    i_req, i_res = columns[0], columns[1]
+    width = len(fieldnames)
+    rows = [row for _, row in chunk]
+    lengths = [len(row) for row in rows]
+    
+    # A missing column points at the empty string appended here (index -1)
+    for row in rows:
+        if len(row) < width:
+            row.extend([''] * (width - len(row)))
+        row.append('')
+    
+    # Decode the Request and Response columns in one tight pass each
+    requests = [_decode(row[i_req]) for row in rows]
+    responses = [_decode(row[i_res]) for row in rows]
+    
+    encoded = []
+    errors = []
+    for (idx, row), n_fields, raw_req, raw_res in zip(chunk, lengths, requests, responses):
+        try:
+            encoded.append(_build(row, raw_req, raw_res, fieldnames, columns, default_time,
+                                  preserve_all_data, n_fields))
+        except Exception as e:
+            # Formatting is skipped for errors that will never be printed
+            errors.append((idx, str(e)[:100] if len(errors) < MAX_REPORTED_ERRORS else None))
+    return b',\n      '.join(encoded), len(encoded), errors
 
-def convert_csv_to_har_stream(csv_file_path, output_har_path, preserve_all_data=True):
+def iter_row_chunks(reader, chunk_size=256, chunk_bytes=16 << 20):
+    """
+    Group the non-blank CSV rows into lists of (idx, row) pairs.
+    
+    A chunk is closed after chunk_size rows or once its fields add up to
+    chunk_bytes characters, so rows carrying huge Request/Response blobs
+    do not pile up in memory while they wait for a worker.
+    """
+    chunk = []
+    size = 0
+    for idx, row in enumerate(reader, 1):
+        if not row:
+            continue  # blank line
+        chunk.append((idx, row))
+        size += sum(map(len, row))
+        if len(chunk) >= chunk_size or size >= chunk_bytes:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+def convert_csv_to_har_stream(csv_file_path, output_har_path, preserve_all_data=True, workers=None):
     """
 Convert huge CSV to HAR while saving all data without exception.
     
@@ -191,148 +382,106 @@ Convert huge CSV to HAR while saving all data without exception.
         csv_file_path: CSV file path
         output_har_path: Path of the output HAR file
         preserve_all_data: Save all original columns in a custom field    
+        workers: Number of worker processes (default: CPU count, 1 = no pool)
         """
     
     if not os.path.exists(csv_file_path):
         print(f" File not found: {csv_file_path}")
         return False
     
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
     processed_count = 0
     error_count = 0
     
     try:
-        with open(csv_file_path, 'r', encoding='utf-8', errors='replace') as f_in, \
-             open(output_har_path, 'w', encoding='utf-8') as f_out:
+        # newline='' lets the C csv parser handle quoted newlines itself;
+        # a 1 MiB read buffer keeps it fed on multi-GB exports
+        with open(csv_file_path, 'r', encoding='utf-8', errors='replace',
+                  newline='', buffering=1 << 20) as f_in, \
+             open(output_har_path, 'wb', buffering=8 << 20) as f_out:
             
-            reader = csv.DictReader(f_in)
+            reader = csv.reader(f_in)
+            fieldnames = next(reader, [])
             
             # Print the column names to check
-            if reader.fieldnames:
-                print(f"📋 Available columns: {', '.join(reader.fieldnames)}")
+            if fieldnames:
+                print(f"📋 Available columns: {', '.join(fieldnames)}")
+            
+            convert_chunk = partial(build_entries_chunk, fieldnames=fieldnames,
+                                    columns=resolve_columns(fieldnames),
+                                    default_time=datetime.now().isoformat(),
+                                    preserve_all_data=preserve_all_data)
             
             # Write the beginning of the HAR file
-            f_out.write('{\n  "log": {\n')
-            f_out.write('    "version": "1.2",\n')
-            f_out.write('    "creator": {\n')
-            f_out.write('      "name": "Complete CSV to HAR Converter",\n')
-            f_out.write('      "version": "4.0",\n')
-            f_out.write('      "comment": "Preserves all original CSV data"\n')
-            f_out.write('    },\n')
-            f_out.write('    "entries": [\n')
+            f_out.write(b'{\n  "log": {\n')
+            f_out.write(b'    "version": "1.2",\n')
+            f_out.write(b'    "creator": {\n')
+            f_out.write(b'      "name": "Complete CSV to HAR Converter",\n')
+            f_out.write(b'      "version": "4.0",\n')
+            f_out.write(b'      "comment": "Preserves all original CSV data"\n')
+            f_out.write(b'    },\n')
+            f_out.write(b'    "entries": [\n')
             
             first_entry = True
+            # The HAR is written once and never read back, so every 64 MiB
+            # the written pages are handed back instead of filling the cache
+            unadvised = 0
             
-            print("🚀 Start processing(Streaming Mode)...")
+            print(f"🚀 Start processing(Streaming Mode, {workers} worker(s))...")
             print("=" * 60)
             
-            for idx, row in enumerate(reader, 1):
-                try:
-                    # Decryption if present
-                    raw_req = decode_base64_safe(row.get('Request', ''))
-                    raw_res = decode_base64_safe(row.get('Response', ''))
-                    
-                    # Extract Headers
-                    req_headers = parse_http_headers(raw_req)
-                    res_headers = parse_http_headers(raw_res)
-                    
-                    # Extract Cookies
-                    req_cookies = parse_cookies_from_headers(req_headers)
-                    res_cookies = parse_cookies_from_headers(res_headers)
-                    
-                    # Extract Bodies
-                    req_body = extract_body(raw_req)
-                    res_body = extract_body(raw_res)
-                    
-                    # Extract MIME type from headers or CSV
-                    response_mime = get_mime_type_from_headers(res_headers) or row.get('MIME type', '').strip()
-                    
-                    # Built Request
-                    method = row.get('Method', 'GET').strip() or 'GET'
-                    url = row.get('URL', '').strip()
-                    
-                    request_obj = {
-                        "method": method,
-                        "url": url,
-                        "httpVersion": extract_http_version(raw_req),
-                        "cookies": req_cookies,
-                        "headers": req_headers,
-                        "queryString": extract_query_string(url),
-                        "headersSize": calculate_headers_size(req_headers),
-                        "bodySize": len(req_body.encode('utf-8')) if req_body else 0
-                    }
-                    
-                    # Add postData if it exists
-                    if req_body and method.upper() in ["POST", "PUT", "PATCH", "DELETE"]:
-                        request_mime = get_mime_type_from_headers(req_headers) or "application/octet-stream"
-                        request_obj["postData"] = {
-                            "mimeType": request_mime,
-                            "text": req_body,
-                            "params": []
-                        }
-                    
-                    # Build Response
-                    status_code = safe_int(row.get('Status code'))
-                    content_size = safe_int(row.get('Length'), -1)
-                    
-                    response_obj = {
-                        "status": status_code,
-                        "statusText": extract_status_text(raw_res),
-                        "httpVersion": extract_http_version(raw_res) if raw_res else extract_http_version(raw_req),
-                        "cookies": res_cookies,
-                        "headers": res_headers,
-                        "content": {
-                            "size": content_size,
-                            "mimeType": response_mime,
-                            "text": res_body,
-                            "encoding": "utf-8"
-                        },
-                        "redirectURL": row.get('Redirect URL', '').strip(),
-                        "headersSize": calculate_headers_size(res_headers),
-                        "bodySize": content_size
-                    }
-                    
-                    # Calculate time
-                    timings = calculate_timings(row)
-                    total_time = sum(v for v in timings.values() if v > 0)
-                    
-                    # Build Entry
-                    entry = {
-                        "startedDateTime": row.get('Time', datetime.now().isoformat()),
-                        "time": total_time,
-                        "request": request_obj,
-                        "response": response_obj,
-                        "cache": {},
-                        "timings": timings,
-                        "serverIPAddress": row.get('IP', '').strip(),
-                        "connection": row.get('Connection ID', '').strip()
-                    }
-                    
-                    # Save all original data (very important!)
-                    if preserve_all_data:
-                        entry["_csvOriginalData"] = {k: v for k, v in row.items()}
-                    
-                    # Write the item
+            def write_chunk(result, last_idx):
+                """Write one converted chunk, in input order"""
+                nonlocal first_entry, processed_count, error_count, unadvised
+                blob, processed, errors = result
+                
+                for idx, message in errors:
+                    error_count += 1
+                    if error_count <= MAX_REPORTED_ERRORS:
+                        print(f"\n⚠️ Row error {idx}: {message}")
+                
+                if processed:
+                    # Write the items
                     if not first_entry:
-                        f_out.write(',\n')
-                    
-                    f_out.write('      ')
-                    json.dump(entry, f_out, ensure_ascii=False, indent=2)
-                    
+                        f_out.write(b',\n')
+                    f_out.write(b'      ')
+                    f_out.write(blob)
                     first_entry = False
-                    processed_count += 1
+                    processed_count += processed
                     
-                    # Progress report
-                    if idx % 500 == 0:
-                        print(f"⏳ proccess: {idx:,} ...", end='\r')
+                    # Counted by hand: tell() fails on non-seekable outputs
+                    unadvised += len(blob)
+                    if unadvised >= 64 << 20:
+                        drop_written_pages(f_out)
+                        unadvised = 0
                 
-                except Exception as e:
-                    error_count += 1
-                    if error_count <= 5:  # Print only the first 5 errors
-                        print(f"\n⚠️ Row error {idx}: {str(e)[:100]}")
-                    continue
+                # Progress report
+                print(f"⏳ proccess: {last_idx:,} ...", end='\r')
+            
+            if workers <= 1:
+                for chunk in iter_row_chunks(reader):
+                    write_chunk(convert_chunk(chunk), chunk[-1][0])
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    # Keep a bounded number of chunks in flight so the whole
+                    # file is never queued in memory; results are written in
+                    # submission order
+                    pending = deque()
+                    for chunk in iter_row_chunks(reader):
+                        pending.append((executor.submit(convert_chunk, chunk), chunk[-1][0]))
+                        if len(pending) >= workers * 2:
+                            future, last_idx = pending.popleft()
+                            write_chunk(future.result(), last_idx)
+                    while pending:
+                        future, last_idx = pending.popleft()
+                        write_chunk(future.result(), last_idx)
             
             # Close the HAR file
-            f_out.write('\n    ]\n  }\n}')
+            f_out.write(b'\n    ]\n  }\n}')
+            drop_written_pages(f_out)
+            f_out.flush()
             
             # The report is final
             print("\n" + "=" * 60)
@@ -2,18 +2,126 @@
 # -*- coding: utf-8 -*-
 
 import json
+import os
+import re
 import sys
+import time
 import base64
-import xml.etree.ElementTree as ET
-from datetime import datetime
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+from urllib.parse import parse_qsl
+from xml.parsers import expat
+
+try:
+    # Faster entry encoding (optional)
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Rate-limited progress bar (optional, falls back to sparse prints)
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_burp_time(time_str: str) -> Optional[str]:
+    """Parse Burp's "Sat Jan 17 17:08:18 EET 2026" without strptime;
+    None if the string does not have that shape
+    
+    Zone abbreviations are ambiguous, so only two are resolved: UTC/GMT get
+    'Z', and this machine's own zone (time.tzname) gets the local offset.
+    Any other zone is labelled 'Z' with its clock time unchanged, as before."""
+    parts = time_str.split()
+    if len(parts) != 6 or parts[1] not in _MONTHS:
+        return None
+    _, month, day, clock, zone, year = parts
+    hms = clock.split(':')
+    if len(hms) != 3 or not (day.isdecimal() and year.isdecimal() and all(p.isdecimal() for p in hms)):
+        return None
+    try:
+        # Only out-of-range values (e.g. day 31 in a 30-day month) get here
+        dt = datetime(int(year), _MONTHS[month], int(day), int(hms[0]), int(hms[1]), int(hms[2]))
+    except ValueError:
+        return None
+    if zone not in ('UTC', 'GMT') and zone in time.tzname:
+        return dt.astimezone().isoformat()
+    return dt.isoformat() + 'Z'
+
+# One "Name: value" header line; findall runs the per-line loop in C.
+# Anchored to line starts so a long line without a colon is rejected once
+# instead of being rescanned from every offset (quadratic)
+_HDR_RE = re.compile(rb'(?m)^([^:\r\n]+):[ \t]*([^\r\n]*)(?:\r\n|\n|$)')
+
+
+# <item>s per pool task: large enough to amortize pickling, small enough
+# to keep every worker busy
+ITEM_BATCH_SIZE = 64
+
+# Bytes fed to expat per Parse() call
+READ_SIZE = 1 << 20
+
+# --fast: requests of these methods below this size are assumed bodiless
+FAST_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS'))
+FAST_MAX_REQUEST = 4096
+
+# Items between two progress lines when tqdm is not installed
+PROGRESS_EVERY = 1000
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, with orjson when it is available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            pass  # orjson refuses some values json accepts
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj).encode('utf-8')
 
 
 class BurpXMLToHAR:
     """Burp Suite XML to HAR Converter -100% Accuracy"""
     
-    def __init__(self):
+    HAR_CREATOR = {
+        "name": "Burp XML to HAR Converter",
+        "version": "1.0",
+        "comment": "Converted from Burp Suite XML export"
+    }
+    HAR_BROWSER = {
+        "name": "Unknown",
+        "version": "Unknown"
+    }
+    # Identical for every entry, so shared rather than rebuilt per item
+    HAR_CACHE = {}
+    HAR_TIMINGS = {
+        "blocked": 0,
+        "dns": 0,
+        "connect": 0,
+        "send": 1,
+        "wait": 50,
+        "receive": 49,
+        "ssl": 0
+    }
+    
+    def __init__(self, fast: bool = False):
+        # fast: trust Burp's own <method>/<status>/<mimetype> fields where
+        # that saves parsing (see process_item)
+        self.fast = fast
+        # Entries are kept as compact JSON bytes, not nested dicts: they are
+        # written out verbatim and take a fraction of the memory
         self.entries = []
         self.stats = {
             'total_items': 0,
@@ -21,378 +129,457 @@ class BurpXMLToHAR:
             'errors': []
         }
     
-    def parse_headers(self, header_text: str) -> List[Dict[str, str]]:
-        """Analyze headers from HTTP"""
+    @staticmethod
+    def _text(value: Optional[str], default: str = "") -> str:
+        """Stripped text of an optional field"""
+        return value.strip() if value else default
+    
+    def parse_headers(self, header_block) -> Tuple[List[Dict[str, str]], Dict[str, List[str]]]:
+        """Analyze the header block (bytes or a memoryview, without the
+        request/response line); also returns their values indexed by
+        lower-cased name"""
         headers = []
-        lines = header_text.split('\r\n')  # 🔥 HTTP standard
-        if not lines:
-            lines = header_text.split('\n')  # fallback
-        
-        for line in lines[1:]:  # Skip the first line (request/response line)
-            line = line.strip()
-            if not line:
-                break
-            
-            if ':' in line:
-                name, value = line.split(':', 1)
-                headers.append({
-                    "name": name.strip(),
-                    "value": value.strip()
-                })
-        
-        return headers
+        headers_by_lc = {}
+        
+        for name, value in _HDR_RE.findall(header_block):
+            name = name.strip().decode('utf-8', errors='replace')
+            value = value.strip().decode('utf-8', errors='replace')
+            headers.append({
+                "name": name,
+                "value": value
+            })
+            # Interned so the recurring names share one object across items
+            # and the lookups below compare by identity
+            headers_by_lc.setdefault(sys.intern(name.lower()), []).append(value)
+        
+        return headers, headers_by_lc
     
-    def parse_cookies(self, headers: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    def parse_cookies(self, headers_by_lc: Dict[str, List[str]]) -> List[Dict[str, str]]:
         """Extract cookies from headers"""
         cookies = []
         
-        for h in headers:
-            if h['name'].lower() == 'cookie':
-                for cookie in h['value'].split(';'):
-                    cookie = cookie.strip()
-                    if '=' in cookie:
-                        name, value = cookie.split('=', 1)
-                        cookies.append({
-                            "name": name.strip(),
-                            "value": value.strip()
-                        })
+        for header_value in headers_by_lc.get('cookie', ()):
+            for cookie in header_value.split(';'):
+                cookie = cookie.strip()
+                if '=' in cookie:
+                    name, value = cookie.split('=', 1)
+                    cookies.append({
+                        "name": name.strip(),
+                        "value": value.strip()
+                    })
         
         return cookies
     
-    def extract_set_cookies(self, headers: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    def extract_set_cookies(self, headers_by_lc: Dict[str, List[str]]) -> List[Dict[str, str]]:
         """Extract Set-Cookie from response"""
         cookies = []
         
-        for h in headers:
-            if h['name'].lower() == 'set-cookie':
-                parts = h['value'].split(';')
-                if parts and '=' in parts[0]:
-                    name, value = parts[0].split('=', 1)
-                    cookies.append({
-                        "name": name.strip(),
-                        "value": value.strip()
-                    })
+        for header_value in headers_by_lc.get('set-cookie', ()):
+            pair = header_value.partition(';')[0]
+            if '=' in pair:
+                name, _, value = pair.partition('=')
+                cookies.append({
+                    "name": name.strip(),
+                    "value": value.strip()
+                })
         
         return cookies
     
     def parse_query_string(self, url: str) -> List[Dict[str, str]]:
         """Extract query parameters"""
-        params = []
-        
         if '?' not in url:
-            return params
-        
-        query = url.split('?', 1)[1]
-        if '#' in query:
-            query = query.split('#')[0]
-        
-        for param in query.split('&'):
-            if '=' in param:
-                name, value = param.split('=', 1)
-                params.append({
-                    "name": name,
-                    "value": value
-                })
-            elif param:
-                params.append({
-                    "name": param,
-                    "value": ""
-                })
-        
-        return params
+            return []
+        
+        # Plain string slicing: urlsplit() would reject the whole URL over
+        # a malformed host (e.g. an unbalanced "[")
+        query = url.partition('#')[0].partition('?')[2]
+        return [
+            {"name": name, "value": value}
+            for name, value in parse_qsl(query, keep_blank_values=True)
+        ]
     
-    def decode_base64_safe(self, data: str) -> str:
-        """Decode base64 safely"""
+    def decode_base64_bytes(self, data: str) -> bytes:
+        """Decode base64 safely, keeping the raw bytes"""
         try:
-            decoded = base64.b64decode(data).decode('utf-8', errors='replace')
-            return decoded
+            return base64.b64decode(data, validate=False)
         except Exception as e:
             self.stats['errors'].append(f"Base64 decode error: {e}")
-            return ""
+            return b""
     
-    def parse_http_request(self, request_text: str) -> tuple:
+    def split_http_message(self, message: bytes, with_body: bool = True) -> tuple:
+        """Split a raw HTTP message into (first line, header block, body)
+        
+        Only the short first line is decoded here. The header block is a
+        memoryview into message (parse_headers scans it in place) and the
+        body is the one copy made of the payload (None if not with_body)."""
+        head_end = message.find(b'\r\n\r\n')  # 🔥 HTTP Used \r\n
+        body_start = head_end + 4
+        if head_end < 0:
+            head_end = message.find(b'\n\n')
+            body_start = head_end + 2
+        if head_end < 0:
+            head_end = body_start = len(message)
+        
+        # XML parsers turn CRLF into LF, so end the start line at the first
+        # b'\n' and drop a trailing b'\r'
+        line_end = message.find(b'\n', 0, head_end)
+        if line_end < 0:
+            line_end = headers_start = head_end
+        else:
+            headers_start = line_end + 1
+        
+        first_line = message[:line_end].strip().decode('utf-8', errors='replace')
+        header_block = memoryview(message)[headers_start:head_end]
+        if not with_body:
+            return first_line, header_block, None
+        return first_line, header_block, message[body_start:].strip() or None
+    
+    def parse_http_request(self, request_text: bytes, with_body: bool = True) -> tuple:
         """تحليل HTTP request"""
-        lines = request_text.split('\r\n')  # 🔥 HTTP Used \r\n
-        if not lines:
-            return None, None, None, None, None
-        
         # First line: GET /path HTTP/1.1
-        first_line = lines[0].strip()
+        first_line, header_block, body = self.split_http_message(request_text, with_body)
         parts = first_line.split(' ')
         
         if len(parts) < 3:
-            return None, None, None, None, None
+            return None, None, None, None, None, None
         
         method = parts[0]
         path = parts[1]
         http_version = parts[2]
         
         # Headers
-        headers = self.parse_headers(request_text)
-        
-        # Body (everything after a blank line)
-        body = None
-        body_start = False
-        body_lines = []
+        headers, headers_by_lc = self.parse_headers(header_block)
         
-        for line in lines:
-            if body_start:
-                body_lines.append(line)
-            elif not line.strip():
-                body_start = True
-        
-        if body_lines:
-            body = '\r\n'.join(body_lines).strip()
-        
-        return method, path, http_version, headers, body
+        return method, path, http_version, headers, headers_by_lc, body
     
-    def parse_http_response(self, response_text: str) -> tuple:
+    def parse_http_response(self, response_text: bytes) -> tuple:
         """تحليل HTTP response"""
-        lines = response_text.split('\r\n')  # 🔥 HTTP Used \r\n
-        if not lines:
-            return None, None, None, None, None
-        
         # First line: HTTP/1.1 200 OK
-        first_line = lines[0].strip()
+        first_line, header_block, body = self.split_http_message(response_text)
         parts = first_line.split(' ', 2)
         
         if len(parts) < 3:
-            return None, None, None, None, None
+            return None, None, None, None, None, None
         
         http_version = parts[0]
         status_code = int(parts[1])
         status_text = parts[2]
         
         # Headers
-        headers = self.parse_headers(response_text)
+        headers, headers_by_lc = self.parse_headers(header_block)
         
-        # Body
-        body = None
-        body_start = False
-        body_lines = []
-        
-        for line in lines:
-            if body_start:
-                body_lines.append(line)
-            elif not line.strip():
-                body_start = True
-        
-        if body_lines:
-            body = '\r\n'.join(body_lines).strip()
-        
-        return http_version, status_code, status_text, headers, body
+        return http_version, status_code, status_text, headers, headers_by_lc, body
     
-    def parse_timestamp(self, time_str: str) -> str:
-        """Convert timestamp from XML"""
-        try:
-            # Format: "Sat Jan 17 17:08:18 EET 2026"
-            dt = datetime.strptime(time_str.strip(), "%a %b %d %H:%M:%S %Z %Y")
-            return dt.isoformat() + 'Z'
-        except:
-            return datetime.now().isoformat() + 'Z'
+    def parse_timestamp(self, time_str: Optional[str]) -> Optional[str]:
+        """Convert timestamp from XML (None if it is missing or malformed)"""
+        if not time_str:
+            return None
+        # Format: "Sat Jan 17 17:08:18 EET 2026" (repeats a lot, hence the cache)
+        return _parse_burp_time(time_str.strip())
     
-    def parse_xml_file(self, filepath: str):
-        """Read and analyze XML from Burp Suite"""
+    def process_item(self, idx: int, fields: Dict[str, str]) -> Optional[Dict]:
+        """Build the HAR entry of one item, or None if it has to be skipped"""
+        _text = self._text  # called for most fields
         
         try:
-            tree = ET.parse(filepath)
-            root = tree.getroot()
-            
-            items = root.findall('item')
-            self.stats['total_items'] = len(items)
-            
-            print(f"📊 was found{len(items)} item In the file\n")
-            
-            for idx, item in enumerate(items, 1):
-                try:
-                    # Basic data extraction
-                    time_elem = item.find('time')
-                    url_elem = item.find('url')
-                    host_elem = item.find('host')
-                    port_elem = item.find('port')
-                    protocol_elem = item.find('protocol')
-                    method_elem = item.find('method')
-                    request_elem = item.find('request')
-                    status_elem = item.find('status')
-                    response_elem = item.find('response')
-                    mimetype_elem = item.find('mimetype')
-                    
-                    if url_elem is None or request_elem is None:
-                        continue
-                    
-                    # Timestamp
-                    timestamp = self.parse_timestamp(time_elem.text) if time_elem is not None else datetime.now().isoformat() + 'Z'
-                    
-                    # URL
-                    url = url_elem.text.strip() if url_elem.text else ""
-                    if not url:
-                        continue
-                    
-                    # Host & IP
-                    host = host_elem.text.strip() if host_elem is not None and host_elem.text else ""
-                    ip = host_elem.get('ip', '') if host_elem is not None else ""
-                    
-                    # Port & Protocol
-                    port = port_elem.text.strip() if port_elem is not None and port_elem.text else "443"
-                    protocol = protocol_elem.text.strip() if protocol_elem is not None and protocol_elem.text else "https"
-                    
-                    # ===== Request Parsing =====
-                    request_data = request_elem.text or ""
-                    is_base64_request = request_elem.get('base64', 'false') == 'true'
-                    
-                    if is_base64_request:
-                        request_data = self.decode_base64_safe(request_data)
-                    
-                    method, path, http_version, req_headers, req_body = self.parse_http_request(request_data)
-                    
-                    if not method:
-                        method = method_elem.text.strip() if method_elem is not None and method_elem.text else "GET"
-                    
-                    # Query String
-                    query_string = self.parse_query_string(url)
-                    
-                    # Cookies
-                    cookies = self.parse_cookies(req_headers)
-                    
-                    # Content Type & Length
-                    content_type = "application/octet-stream"
-                    content_length = 0
-                    
-                    for h in req_headers:
-                        if h['name'].lower() == 'content-type':
-                            content_type = h['value'].split(';')[0].strip()
-                        elif h['name'].lower() == 'content-length':
-                            try:
-                                content_length = int(h['value'])
-                            except:
-                                pass
-                    
-                    # 🔥 Actual body size calculation
-                    actual_body_size = len(req_body.encode('utf-8')) if req_body else 0
-                    
-                    # Request Object
-                    request_obj = {
-                        "method": method,
-                        "url": url,
-                        "httpVersion": http_version or "HTTP/1.1",
-                        "headers": req_headers,
-                        "queryString": query_string,
-                        "cookies": cookies,
-                        "headersSize": -1,
-                        "bodySize": actual_body_size  # 🔥 Actual size
-                    }
-                    
-                    if req_body:
-                        request_obj["postData"] = {
-                            "mimeType": content_type,
-                            "text": req_body
-                        }
-                    
-                    # ===== Response Parsing =====
-                    response_data = response_elem.text or "" if response_elem is not None else ""
-                    is_base64_response = response_elem.get('base64', 'false') == 'true' if response_elem is not None else False
-                    
-                    if is_base64_response:
-                        response_data = self.decode_base64_safe(response_data)
-                    
-                    resp_version, status_code, status_text, resp_headers, resp_body = self.parse_http_response(response_data)
-                    
-                    if status_code is None:
-                        status_code = int(status_elem.text.strip()) if status_elem is not None and status_elem.text else 0
-                        status_text = ""
-                    
-                    # Response Content Type
-                    resp_content_type = mimetype_elem.text.strip() if mimetype_elem is not None and mimetype_elem.text else "text/html"
-                    
-                    for h in resp_headers:
-                        if h['name'].lower() == 'content-type':
-                            resp_content_type = h['value'].split(';')[0].strip()
-                            break
-                    
-                    # Response Cookies
-                    response_cookies = self.extract_set_cookies(resp_headers)
-                    
-                    # 🔥 Calculate the actual response size
-                    actual_resp_size = len(resp_body.encode('utf-8')) if resp_body else 0
-                    
-                    # Response Object
-                    response_obj = {
-                        "status": status_code,
-                        "statusText": status_text or "",
-                        "httpVersion": resp_version or "HTTP/1.1",
-                        "headers": resp_headers,
-                        "cookies": response_cookies,
-                        "content": {
-                            "size": actual_resp_size,  # 🔥 Actual size
-                            "mimeType": resp_content_type,
-                            "text": resp_body or ""
-                        },
-                        "redirectURL": "",
-                        "headersSize": -1,
-                        "bodySize": actual_resp_size  # 🔥 Actual size
-                    }
-                    
-                    # HAR Entry
-                    entry = {
-                        "startedDateTime": timestamp,
-                        "time": 100,
-                        "request": request_obj,
-                        "response": response_obj,
-                        "cache": {},
-                        "timings": {
-                            "blocked": 0,
-                            "dns": 0,
-                            "connect": 0,
-                            "send": 1,
-                            "wait": 50,
-                            "receive": 49,
-                            "ssl": 0
-                        }
-                    }
-                    
-                    if ip:
-                        entry["serverIPAddress"] = ip
-                    
-                    self.entries.append(entry)
-                    self.stats['entries_created'] += 1
-                    
-                    if idx % 10 == 0:
-                        print(f"  ⚡ Process: {idx}/{len(items)} items...")
+            if 'url' not in fields or 'request' not in fields:
+                return None
+            
+            # Timestamp
+            timestamp = self.parse_timestamp(fields.get('time'))
+            if timestamp is None:
+                timestamp = datetime.now(timezone.utc).isoformat()
+            
+            # URL
+            url = _text(fields['url'])
+            if not url:
+                return None
+            
+            # Host & IP
+            host = _text(fields.get('host'))
+            ip = fields.get('host@ip', '')
+            
+            # Port & Protocol
+            port = _text(fields.get('port'), "443")
+            protocol = _text(fields.get('protocol'), "https")
+            
+            # ===== Request Parsing =====
+            request_data = fields['request'] or ""
+            is_base64_request = fields.get('request@base64', 'false') == 'true'
+            
+            if is_base64_request:
+                request_data = self.decode_base64_bytes(request_data)
+            else:
+                request_data = request_data.encode('utf-8')
+            
+            # --fast: small GET/HEAD/OPTIONS requests carry no body worth scanning
+            with_body = not (self.fast
+                             and _text(fields.get('method')) in FAST_METHODS
+                             and len(request_data) < FAST_MAX_REQUEST)
+            
+            method, path, http_version, req_headers, req_headers_by_lc, req_body = self.parse_http_request(request_data, with_body)
+            
+            if not method:
+                method = _text(fields.get('method'), "GET")
+            
+            # Query String
+            query_string = self.parse_query_string(url)
+            
+            # Cookies
+            cookies = self.parse_cookies(req_headers_by_lc)
+            
+            # Content Type (sizes come from the actual body, not Content-Length)
+            content_type = "application/octet-stream"
+            
+            if 'content-type' in req_headers_by_lc:
+                content_type = req_headers_by_lc['content-type'][-1].partition(';')[0].strip()
+            
+            # 🔥 Actual body size calculation
+            actual_body_size = len(req_body) if req_body else 0
+            
+            # Request Object
+            request_obj = {
+                "method": method,
+                "url": url,
+                "httpVersion": http_version or "HTTP/1.1",
+                "headers": req_headers,
+                "queryString": query_string,
+                "cookies": cookies,
+                "headersSize": -1,
+                "bodySize": actual_body_size  # 🔥 Actual size
+            }
+            
+            if req_body:
+                request_obj["postData"] = {
+                    "mimeType": content_type,
+                    "text": req_body.decode('utf-8', errors='replace')
+                }
+            
+            # ===== Response Parsing =====
+            response_data = fields.get('response') or ""
+            
+            if self.fast and not response_data and fields.get('mimetype'):
+                # --fast: Burp kept no response, describe it from its own
+                # <status>/<mimetype> fields instead of dropping the item
+                resp_version, status_code, status_text = None, int(_text(fields.get('status'), "0")), ""
+                resp_headers, resp_headers_by_lc, resp_body = [], {}, None
+            else:
+                is_base64_response = fields.get('response@base64', 'false') == 'true'
+                
+                if is_base64_response:
+                    response_data = self.decode_base64_bytes(response_data)
+                else:
+                    response_data = response_data.encode('utf-8')
+                
+                resp_version, status_code, status_text, resp_headers, resp_headers_by_lc, resp_body = self.parse_http_response(response_data)
                 
-                except Exception as e:
-                    self.stats['errors'].append(f"Item {idx} error: {e}")
-                    continue
+                if status_code is None:
+                    status_code = int(_text(fields.get('status'), "0"))
+                    status_text = ""
+            
+            # Response Content Type
+            resp_content_type = _text(fields.get('mimetype'), "text/html")
+            
+            if 'content-type' in resp_headers_by_lc:
+                resp_content_type = resp_headers_by_lc['content-type'][0].partition(';')[0].strip()
+            
+            # Response Cookies
+            response_cookies = self.extract_set_cookies(resp_headers_by_lc)
+            
+            # 🔥 Calculate the actual response size
+            actual_resp_size = len(resp_body) if resp_body else 0
+            
+            # Response Object
+            response_obj = {
+                "status": status_code,
+                "statusText": status_text or "",
+                "httpVersion": resp_version or "HTTP/1.1",
+                "headers": resp_headers,
+                "cookies": response_cookies,
+                "content": {
+                    "size": actual_resp_size,  # 🔥 Actual size
+                    "mimeType": resp_content_type,
+                    "text": resp_body.decode('utf-8', errors='replace') if resp_body else ""
+                },
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": actual_resp_size  # 🔥 Actual size
+            }
+            
+            # HAR Entry
+            entry = {
+                "startedDateTime": timestamp,
+                "time": 100,
+                "request": request_obj,
+                "response": response_obj,
+                "cache": self.HAR_CACHE,
+                "timings": self.HAR_TIMINGS
+            }
+            
+            if ip:
+                entry["serverIPAddress"] = ip
+            
+            return entry
+        
+        except Exception as e:
+            self.stats['errors'].append(f"Item {idx} error: {e}")
+            return None
+    
+    def parse_xml_file(self, filepath: str, workers: Optional[int] = None):
+        """Read and analyze XML from Burp Suite
+        
+        Items are converted in a process pool (workers defaults to the CPU
+        count; 1 keeps everything in this process)."""
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        def _collect(result):
+            entries, errors = result
+            self.entries.extend(entries)
+            self.stats['entries_created'] += len(entries)
+            self.stats['errors'].extend(errors)
+        
+        try:
+            if workers <= 1:
+                for batch in self._iter_batches(filepath):
+                    _collect(_build_entries(batch, self.fast))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    # Two batches per worker: expat never runs far ahead of
+                    # the pool, and entries keep the export's item order
+                    pending = deque()
+                    for batch in self._iter_batches(filepath):
+                        pending.append(executor.submit(_build_entries, batch, self.fast))
+                        if len(pending) >= workers * 2:
+                            _collect(pending.popleft().result())
+                    while pending:
+                        _collect(pending.popleft().result())
+            
+            print(f"📊 was found{self.stats['total_items']} item In the file\n")
         
         except Exception as e:
             raise Exception(f"Failed to read XML: {e}")
     
+    def _iter_batches(self, filepath: str):
+        """Yield lists of up to ITEM_BATCH_SIZE (idx, fields) pairs"""
+        items = self._iter_items(filepath)
+        if tqdm is not None:
+            items = tqdm(items, desc="  ⚡ Process", unit='item')
+        
+        stats = self.stats
+        batch = []
+        for idx, fields in enumerate(items, 1):
+            stats['total_items'] = idx
+            batch.append((idx, fields))
+            
+            if tqdm is None and idx % PROGRESS_EVERY == 0:
+                print(f"  ⚡ Process: {idx} items...")
+            
+            if len(batch) == ITEM_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _iter_items(self, filepath: str):
+        """Yield the fields of each <item> straight from expat events
+        
+        No element tree is built: only the direct children of <item> are
+        kept, as {tag: text, 'tag@attr': value}."""
+        items = []    # items completed by the last Parse() call
+        item = None   # fields of the <item> being read
+        depth = 0     # element depth below that <item>
+        text = None   # character data of the current field
+        
+        def start(name, attrs):
+            nonlocal item, depth, text
+            if item is None:
+                if name == 'item':
+                    item, depth = {}, 0
+                return
+            depth += 1
+            if depth == 1:
+                text = []
+                for attr, value in attrs.items():
+                    item[f"{name}@{attr}"] = value
+        
+        def end(name):
+            nonlocal item, depth, text
+            if item is None:
+                return
+            if depth == 0:
+                items.append(item)
+                item = None
+                return
+            if depth == 1:
+                item[name] = ''.join(text) or None
+                text = None
+            depth -= 1
+        
+        def data(chunk):
+            if depth == 1 and text is not None:
+                text.append(chunk)
+        
+        parser = expat.ParserCreate()
+        # Deliver each text node in as few calls as possible instead of
+        # one per line / 8 KiB
+        parser.buffer_text = True
+        parser.buffer_size = READ_SIZE
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = data
+        
+        with open(filepath, 'rb', buffering=0) as fh:
+            if hasattr(os, 'posix_fadvise') and fh.seekable():
+                # The export is read once, front to back: ask for read-ahead
+                # (pipes such as /dev/stdin have nothing to advise)
+                os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            # Stream the export: items are handed out after every chunk
+            # and then dropped, so memory stays O(one chunk)
+            while True:
+                chunk = fh.read(READ_SIZE)
+                parser.Parse(chunk, not chunk)
+                if items:
+                    yield from items
+                    items.clear()
+                if not chunk:
+                    break
+    
     def generate_har(self) -> Dict:
         """HAR generation is 100% compliant with standards"""
         return {
             "log": {
                 "version": "1.2",
-                "creator": {
-                    "name": "Burp XML to HAR Converter",
-                    "version": "1.0",
-                    "comment": "Converted from Burp Suite XML export"
-                },
-                "browser": {
-                    "name": "Unknown",
-                    "version": "Unknown"
-                },
+                "creator": self.HAR_CREATOR,
+                "browser": self.HAR_BROWSER,
                 "pages": [],
-                "entries": self.entries,
+                "entries": [json.loads(entry) for entry in self.entries],
                 "comment": f"Converted {len(self.entries)} HTTP transactions from Burp Suite XML"
             }
         }
     
-    def save_har(self, output_path: str):
-        """Save HAR"""
+    def save_har(self, output_path: str, pretty: bool = False):
+        """Save HAR (entries are streamed one by one unless pretty is set)"""
         try:
-            har = self.generate_har()
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(har, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'wb', buffering=1 << 20) as f:
+                if pretty:
+                    f.write(_dumps(self.generate_har(), pretty=True))
+                else:
+                    # Write the envelope by hand so the whole HAR is never
+                    # materialized as one JSON document
+                    f.write(b'{"log":{"version":"1.2","creator":')
+                    f.write(_dumps(self.HAR_CREATOR))
+                    f.write(b',"browser":')
+                    f.write(_dumps(self.HAR_BROWSER))
+                    f.write(b',"pages":[],"entries":[')
+                    for i, entry in enumerate(self.entries):
+                        if i:
+                            f.write(b',')
+                        f.write(entry)
+                    f.write(b'],"comment":')
+                    f.write(_dumps(f"Converted {len(self.entries)} HTTP transactions from Burp Suite XML"))
+                    f.write(b'}}')
             
             print(f"\n{'='*60}")
             print(f"✅Successfully saved!")
@@ -413,22 +600,44 @@ class BurpXMLToHAR:
             raise Exception(f"Failed to save HAR: {e}")
 
 
+def _build_entries(batch, fast: bool = False) -> Tuple[List[bytes], List[str]]:
+    """Pool task: convert a batch of (idx, fields) pairs into encoded
+    entries (bytes pickle far cheaper than nested dicts)"""
+    converter = BurpXMLToHAR(fast=fast)
+    entries = []
+    # Hot loop: bind the per-item callables once
+    process_item = converter.process_item
+    append = entries.append
+    dumps = _dumps
+    for idx, fields in batch:
+        entry = process_item(idx, fields)
+        if entry is not None:
+            append(dumps(entry))
+    return entries, converter.stats['errors']
+
+
 def main():
     print("=" * 60)
     print("  📄 Burp Suite XML to HAR Converter v1.0")
     print(" Burp XML to HAR Converter -100% Accuracy")
     print("=" * 60)
     
-    if len(sys.argv) < 2:
+    args = [arg for arg in sys.argv[1:] if arg not in ('--pretty', '--fast')]
+    pretty = '--pretty' in sys.argv[1:]
+    fast = '--fast' in sys.argv[1:]
+    
+    if len(args) < 1:
         print("\n📖 Usage:")
-        print("  python burp_to_har.py <input.xml> [output.har]\n")
+        print("  python burp_to_har.py <input.xml> [output.har] [--pretty] [--fast]\n")
         print("💡 Examples:")
         print("  python burp_to_har.py burp_export.xml")
-        print("  python burp_to_har.py burp_export.xml output.har\n")
+        print("  python burp_to_har.py burp_export.xml output.har")
+        print("  python burp_to_har.py burp_export.xml output.har --pretty  (indented JSON)")
+        print("  python burp_to_har.py burp_export.xml output.har --fast    (skip bodies of small GET/HEAD/OPTIONS)\n")
         sys.exit(1)
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else "output.har"
+    input_file = args[0]
+    output_file = args[1] if len(args) > 1 else "output.har"
     
     if not Path(input_file).exists():
         print(f"\n❌File not found: {input_file}")
@@ -439,7 +648,7 @@ def main():
     print(f"📏 File size: {file_size:,} bytes ({file_size/1024/1024:.2f} MB)")
     print(f"💾 Output file: {output_file}\n")
     
-    converter = BurpXMLToHAR()
+    converter = BurpXMLToHAR(fast=fast)
     
     try:
         print("🔍 Start analysis...\n")
@@ -449,7 +658,7 @@ def main():
             print("\n⚠️ Warning: No valid entries found!")
             sys.exit(1)
         
-        converter.save_har(output_file)
+        converter.save_har(output_file, pretty=pretty)
         
         print(f"\n{'='*60}")
         print("🎯 Next steps:")